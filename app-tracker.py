@@ -5,16 +5,29 @@ App Tracker - Keep track of your applications, URLs, and related information
 A simple CLI tool to manage your app inventory
 """
 
+import copy
 import json
 import os
+import pickle
+import re
 import sys
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import AbstractSet, Dict, List, Optional
+
+# orjson is considerably faster for both parse and serialize; fall back to
+# the stdlib when it isn't installed
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 # Configuration
 SCRIPT_DIR = Path(__file__).parent
 DATA_FILE = SCRIPT_DIR / "apps.json"
+# Pickled copy of the parsed data, stamped with apps.json's mtime/size, so
+# later invocations can skip the JSON parse entirely
+CACHE_FILE = SCRIPT_DIR / "apps.json.cache"
 
 # Color codes for terminal output
 class Colors:
@@ -28,8 +41,25 @@ class Colors:
     BOLD = '\033[1m'
 
 
+# Fully-rendered status labels so the listing loop doesn't reassemble the
+# same color + title + reset string for every app
+STATUS_LABELS = {
+    'development': f"{Colors.YELLOW}Development{Colors.NC}",
+    'staging': f"{Colors.CYAN}Staging{Colors.NC}",
+    'production': f"{Colors.GREEN}Production{Colors.NC}",
+    'archived': f"{Colors.RED}Archived{Colors.NC}",
+}
+
+# Matches the ANSI color escapes above, for stripping from piped output
+_ANSI_RE = re.compile('\033\\[[0-9;]*m')
+
+
+def _info_line(message: str) -> str:
+    return f"{Colors.BLUE}ℹ {Colors.NC}{message}"
+
+
 def print_info(message: str):
-    print(f"{Colors.BLUE}ℹ {Colors.NC}{message}")
+    print(_info_line(message))
 
 
 def print_success(message: str):
@@ -44,38 +74,160 @@ def print_error(message: str):
     print(f"{Colors.RED}✗{Colors.NC} {message}")
 
 
+def _header_lines(message: str) -> List[str]:
+    bar = f"{Colors.GREEN}{'═' * 60}{Colors.NC}"
+    return ["", bar, f"{Colors.GREEN}  {message}{Colors.NC}", bar, ""]
+
+
 def print_header(message: str):
-    print()
-    print(f"{Colors.GREEN}{'═' * 60}{Colors.NC}")
-    print(f"{Colors.GREEN}  {message}{Colors.NC}")
-    print(f"{Colors.GREEN}{'═' * 60}{Colors.NC}")
-    print()
+    print("\n".join(_header_lines(message)))
 
 
-def load_apps() -> Dict:
-    """Load apps from JSON file"""
-    if not DATA_FILE.exists():
-        return {"apps": []}
+# Parsed-data cache keyed by (path, mtime, size) so repeated loads in one
+# process don't re-read and re-parse the same file
+_CACHE: Dict = {}
 
+
+def _read_cache_file(stamp) -> Optional[Dict]:
+    """Return the sidecar's parsed data if its stamp matches, else None"""
+    if not CACHE_FILE.exists():
+        return None
+    # Anything wrong with the sidecar — unreadable, unpicklable, or not the
+    # (stamp, data) shape we write — just means a re-parse
     try:
-        with open(DATA_FILE, 'r') as f:
-            return json.load(f)
-    except json.JSONDecodeError:
-        print_error(f"Error reading {DATA_FILE}. File may be corrupted.")
-        return {"apps": []}
+        cached_stamp, data = pickle.loads(CACHE_FILE.read_bytes())
+    except Exception:
+        return None
+    return data if cached_stamp == stamp else None
+
+
+def _write_cache_file(stamp, data: Dict):
+    """Refresh the sidecar cache; failures just mean a re-parse next time"""
+    try:
+        tmp_file = CACHE_FILE.with_suffix('.cache.tmp')
+        tmp_file.write_bytes(
+            pickle.dumps((stamp, data), protocol=pickle.HIGHEST_PROTOCOL))
+        os.replace(tmp_file, CACHE_FILE)
+    except OSError:
+        pass
+
+
+def load_apps(readonly: bool = False) -> Dict:
+    """Load apps from JSON file
+
+    Read-only callers (list/view/export) pass readonly=True and share the
+    cached object directly; callers that mutate get a private copy.
+    """
+    # Fast path: nothing on disk means nothing to parse
+    if not DATA_FILE.exists():
+        return {"apps": {}}
+
+    st = DATA_FILE.stat()
+    cache_key = (str(DATA_FILE), st.st_mtime_ns, st.st_size)
+    if cache_key in _CACHE:
+        cached = _CACHE[cache_key]
+        return cached if readonly else copy.deepcopy(cached)
+
+    # The pickled sidecar deserializes much faster than JSON
+    stamp = (st.st_mtime_ns, st.st_size)
+    data = _read_cache_file(stamp)
+    if data is None:
+        try:
+            raw = DATA_FILE.read_bytes()
+            data = orjson.loads(raw) if orjson else json.loads(raw)
+        except ValueError:
+            print_error(f"Error reading {DATA_FILE}. File may be corrupted.")
+            return {"apps": {}}
+
+        # Migrate the legacy list layout to a dict keyed by id (preserves
+        # order)
+        if isinstance(data.get('apps'), list):
+            data['apps'] = {app['id']: app for app in data['apps']}
+
+        _write_cache_file(stamp, data)
+
+    # Cache the parsed object as-is; a later hit hands writers a deepcopy,
+    # and save_apps clears the cache, so mutations that get saved can never
+    # leak into subsequent loads
+    _CACHE.clear()
+    _CACHE[cache_key] = data
+    return data
+
+
+# Above this many apps, pretty-printing the data file stops being worth the
+# extra bytes and serialization time
+_INDENT_THRESHOLD = 500
 
 
 def save_apps(data: Dict):
-    """Save apps to JSON file"""
-    with open(DATA_FILE, 'w') as f:
-        json.dump(data, f, indent=2)
+    """Save apps to JSON file (atomically, via a temp file + rename)"""
+    # APPTRACKER_COMPACT=1 forces compact output regardless of size
+    compact = (os.environ.get('APPTRACKER_COMPACT') == '1'
+               or len(data.get('apps', {})) > _INDENT_THRESHOLD)
+    if orjson:
+        raw = orjson.dumps(data) if compact \
+            else orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    elif compact:
+        raw = json.dumps(data, separators=(',', ':')).encode()
+    else:
+        raw = json.dumps(data, indent=2).encode()
+
+    # Write next to the target and rename so readers never see a partial file
+    tmp_file = DATA_FILE.with_suffix('.json.tmp')
+    tmp_file.write_bytes(raw)
+    # Stamp from the temp file: rename preserves mtime and size, while
+    # statting DATA_FILE after the replace could pick up a concurrent
+    # writer's file and pair its identity with our data
+    st = tmp_file.stat()
+    os.replace(tmp_file, DATA_FILE)
+
+    # Refresh the sidecar so the next invocation skips the JSON parse
+    _write_cache_file((st.st_mtime_ns, st.st_size), data)
+    _CACHE.clear()
+
+
+class _IdTranslate(dict):
+    """Translation table for id slugs: space/underscore become '-',
+    anything not alphanumeric or '-' is dropped.
+
+    str.translate consults this per code point; the full ASCII range is
+    precomputed below, and non-ASCII code points are classified once in
+    __missing__ and remembered for the rest of the run.
+    """
 
+    def __missing__(self, codepoint):
+        char = chr(codepoint)
+        result = char if (char.isalnum() or char == '-') else None
+        self[codepoint] = result
+        return result
 
-def generate_id(name: str, existing_ids: List[str]) -> str:
+
+# Precompute the whole ASCII range so the common case is a pure table
+# lookup with no per-character isalnum calls
+_ID_TRANSLATE = _IdTranslate(
+    {cp: (chr(cp) if chr(cp).isalnum() or cp == ord('-') else None)
+     for cp in range(128)}
+)
+_ID_TRANSLATE[ord(' ')] = '-'
+_ID_TRANSLATE[ord('_')] = '-'
+
+# name -> sanitized slug, so repeated names (e.g. during bulk import) only
+# pay for lower+translate once
+_SLUG_CACHE: Dict[str, str] = {}
+
+
+def generate_id(name: str, existing_ids: AbstractSet[str]) -> str:
     """Generate a unique ID from app name"""
-    base_id = name.lower().replace(' ', '-').replace('_', '-')
-    # Remove special characters
-    base_id = ''.join(c for c in base_id if c.isalnum() or c == '-')
+    # Membership tests must be O(1): callers pass a set or dict key view
+    if isinstance(existing_ids, list):
+        existing_ids = set(existing_ids)
+
+    base_id = _SLUG_CACHE.get(name)
+    if base_id is None:
+        # Lowercase, map separators to '-' and strip special characters in
+        # a single C-level translate pass
+        base_id = name.lower().translate(_ID_TRANSLATE)
+        _SLUG_CACHE[name] = base_id
 
     if base_id not in existing_ids:
         return base_id
@@ -105,7 +257,7 @@ def add_app():
     print_header("Add New App")
 
     data = load_apps()
-    existing_ids = [app['id'] for app in data['apps']]
+    existing_ids = data['apps'].keys()
 
     # Collect app information
     name = get_input("App name", required=True)
@@ -164,7 +316,7 @@ def add_app():
         "updated_at": now
     }
 
-    data['apps'].append(app)
+    data['apps'][app_id] = app
     save_apps(data)
 
     print()
@@ -173,53 +325,122 @@ def add_app():
     print()
 
 
+def import_apps(import_file: str):
+    """Bulk-import apps from a JSON file, saving once at the end"""
+    import_path = Path(import_file)
+    if not import_path.exists():
+        print_error(f"File '{import_file}' not found.")
+        sys.exit(1)
+
+    try:
+        raw = import_path.read_bytes()
+        imported = orjson.loads(raw) if orjson else json.loads(raw)
+    except ValueError:
+        print_error(f"Error reading {import_file}. Not valid JSON.")
+        sys.exit(1)
+
+    # Accept either the native {"apps": ...} layout or a bare list of apps
+    if isinstance(imported, dict):
+        imported = imported.get('apps', imported)
+    if isinstance(imported, dict):
+        imported = list(imported.values())
+
+    if not isinstance(imported, list):
+        print_error(f"Error reading {import_file}. "
+                    "Expected a list of apps or {\"apps\": ...}.")
+        sys.exit(1)
+
+    data = load_apps()
+    existing_ids = data['apps'].keys()
+
+    # One timestamp for the whole batch: formatting datetime.now() per
+    # entry would dominate the loop and the entries land together anyway
+    now = datetime.now().isoformat()
+    count = 0
+    for entry in imported:
+        if not isinstance(entry, dict):
+            print_warning(f"Skipping non-object entry: {entry!r}")
+            continue
+
+        name = entry.get('name')
+        if not name:
+            print_warning("Skipping entry without a name.")
+            continue
+
+        app_id = generate_id(name, existing_ids)
+        app = {
+            "id": app_id,
+            "name": name,
+            "description": entry.get('description', ''),
+            "urls": entry.get('urls', {}),
+            "repository": entry.get('repository', ''),
+            "tech_stack": entry.get('tech_stack', ''),
+            "status": entry.get('status', 'development'),
+            "notes": entry.get('notes', ''),
+            "created_at": entry.get('created_at', now),
+            "updated_at": now
+        }
+        data['apps'][app_id] = app
+        count += 1
+
+    if not count:
+        print_info("No apps imported.")
+        return
+
+    # One save for the whole batch instead of one per app
+    save_apps(data)
+    print_success(f"Imported {count} app(s) from {import_file}")
+    print()
+
+
 def list_apps(filter_status: Optional[str] = None):
     """List all apps"""
-    data = load_apps()
-    apps = data['apps']
+    data = load_apps(readonly=True)
+    apps = list(data['apps'].values())
 
+    # Collect everything — header included — and emit it with one write
+    # instead of a print per line, so the ANSI strip below covers the whole
+    # command's output
     if filter_status:
         apps = [app for app in apps if app['status'] == filter_status]
-        print_header(f"Apps - Status: {filter_status.title()}")
+        lines = _header_lines(f"Apps - Status: {filter_status.title()}")
     else:
-        print_header("All Apps")
+        lines = _header_lines("All Apps")
 
     if not apps:
-        print_info("No apps found.")
-        print()
-        return
-
-    # Status colors
-    status_colors = {
-        'development': Colors.YELLOW,
-        'staging': Colors.CYAN,
-        'production': Colors.GREEN,
-        'archived': Colors.RED
-    }
+        lines.append(_info_line("No apps found."))
+        lines.append("")
 
     for app in apps:
-        status_color = status_colors.get(app['status'], Colors.NC)
-        print(f"{Colors.BOLD}{app['name']}{Colors.NC} ({Colors.CYAN}{app['id']}{Colors.NC})")
-        print(f"  Status: {status_color}{app['status'].title()}{Colors.NC}")
+        status_label = STATUS_LABELS.get(app['status'], app['status'].title())
+        lines.append(f"{Colors.BOLD}{app['name']}{Colors.NC} ({Colors.CYAN}{app['id']}{Colors.NC})")
+        lines.append(f"  Status: {status_label}")
 
         if app.get('description'):
-            print(f"  Description: {app['description']}")
+            lines.append(f"  Description: {app['description']}")
 
         if app.get('urls'):
-            print("  URLs:")
+            lines.append("  URLs:")
             for env, url in app['urls'].items():
-                print(f"    {env.title()}: {Colors.BLUE}{url}{Colors.NC}")
+                lines.append(f"    {env.title()}: {Colors.BLUE}{url}{Colors.NC}")
 
         if app.get('tech_stack'):
-            print(f"  Tech: {app['tech_stack']}")
+            lines.append(f"  Tech: {app['tech_stack']}")
 
-        print()
+        lines.append("")
+
+    output = "\n".join(lines) + "\n"
+    if not sys.stdout.isatty():
+        # Don't send escape bytes into pipes and files
+        output = _ANSI_RE.sub('', output)
+    sys.stdout.write(output)
+    sys.stdout.flush()
 
 
 def view_app(app_id: str):
     """View detailed information about a specific app"""
-    data = load_apps()
-    app = next((a for a in data['apps'] if a['id'] == app_id), None)
+    data = load_apps(readonly=True)
+    app = data['apps'].get(app_id)
 
     if not app:
         print_error(f"App with ID '{app_id}' not found.")
@@ -257,7 +478,7 @@ def view_app(app_id: str):
 def edit_app(app_id: str):
     """Edit an existing app"""
     data = load_apps()
-    app = next((a for a in data['apps'] if a['id'] == app_id), None)
+    app = data['apps'].get(app_id)
 
     if not app:
         print_error(f"App with ID '{app_id}' not found.")
@@ -322,7 +543,7 @@ def edit_app(app_id: str):
 def remove_app(app_id: str):
     """Remove an app from the tracker"""
     data = load_apps()
-    app = next((a for a in data['apps'] if a['id'] == app_id), None)
+    app = data['apps'].get(app_id)
 
     if not app:
         print_error(f"App with ID '{app_id}' not found.")
@@ -335,7 +556,7 @@ def remove_app(app_id: str):
         print_info("Removal cancelled.")
         return
 
-    data['apps'] = [a for a in data['apps'] if a['id'] != app_id]
+    del data['apps'][app_id]
     save_apps(data)
 
     print_success(f"App '{app['name']}' removed successfully!")
@@ -344,49 +565,71 @@ def remove_app(app_id: str):
 
 def export_markdown():
     """Export apps list to markdown format"""
-    data = load_apps()
-    apps = data['apps']
+    output_file = SCRIPT_DIR / "apps-list.md"
+
+    # The export is a pure function of the data file, so if the existing
+    # export is newer than apps.json there is nothing to regenerate
+    if DATA_FILE.exists() and output_file.exists() \
+            and output_file.stat().st_mtime_ns >= DATA_FILE.stat().st_mtime_ns:
+        print_success(f"Apps export already up to date: {output_file}")
+        print()
+        return
+
+    data = load_apps(readonly=True)
+    apps = list(data['apps'].values())
 
     if not apps:
         print_info("No apps to export.")
         return
 
-    output_file = SCRIPT_DIR / "apps-list.md"
-
-    with open(output_file, 'w') as f:
-        f.write("# My Apps\n\n")
-        f.write(f"*Generated on {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}*\n\n")
-
-        # Group by status
-        statuses = ['production', 'staging', 'development', 'archived']
-        for status in statuses:
-            status_apps = [app for app in apps if app['status'] == status]
-            if status_apps:
-                f.write(f"## {status.title()}\n\n")
-                for app in status_apps:
-                    f.write(f"### {app['name']}\n\n")
-                    if app.get('description'):
-                        f.write(f"{app['description']}\n\n")
-                    if app.get('urls'):
-                        f.write("**URLs:**\n")
-                        for env, url in app['urls'].items():
-                            f.write(f"- {env.title()}: {url}\n")
-                        f.write("\n")
-                    if app.get('repository'):
-                        f.write(f"**Repository:** {app['repository']}\n\n")
-                    if app.get('tech_stack'):
-                        f.write(f"**Tech Stack:** {app['tech_stack']}\n\n")
-                    if app.get('notes'):
-                        f.write(f"**Notes:** {app['notes']}\n\n")
-                    f.write("---\n\n")
+    # Group by status in a single pass instead of filtering per status
+    statuses = ['production', 'staging', 'development', 'archived']
+    groups: Dict[str, List] = {status: [] for status in statuses}
+    for app in apps:
+        groups.setdefault(app['status'], []).append(app)
+
+    # Assemble the document in memory and write it in one call rather than
+    # issuing many small f.write()s
+    parts = ["# My Apps\n\n"]
+    parts.append(f"*Generated on {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}*\n\n")
+
+    for status in statuses:
+        status_apps = groups[status]
+        if status_apps:
+            parts.append(f"## {status.title()}\n\n")
+            for app in status_apps:
+                parts.append(f"### {app['name']}\n\n")
+                if app.get('description'):
+                    parts.append(f"{app['description']}\n\n")
+                if app.get('urls'):
+                    parts.append("**URLs:**\n")
+                    for env, url in app['urls'].items():
+                        parts.append(f"- {env.title()}: {url}\n")
+                    parts.append("\n")
+                if app.get('repository'):
+                    parts.append(f"**Repository:** {app['repository']}\n\n")
+                if app.get('tech_stack'):
+                    parts.append(f"**Tech Stack:** {app['tech_stack']}\n\n")
+                if app.get('notes'):
+                    parts.append(f"**Notes:** {app['notes']}\n\n")
+                parts.append("---\n\n")
+
+    output_file.write_text("".join(parts))
 
     print_success(f"Apps exported to {output_file}")
     print()
 
 
+# Built on first help request only; non-help invocations never pay for
+# assembling this text
+_USAGE: Optional[str] = None
+
+
 def print_usage():
     """Print usage information"""
-    print(f"""
+    global _USAGE
+    if _USAGE is None:
+        _USAGE = f"""
 {Colors.BOLD}App Tracker{Colors.NC} - Keep track of your applications
 
 {Colors.BOLD}Usage:{Colors.NC}
@@ -398,6 +641,7 @@ def print_usage():
   {Colors.GREEN}view{Colors.NC} <app-id>         View detailed info about an app
   {Colors.GREEN}edit{Colors.NC} <app-id>         Edit an existing app
   {Colors.GREEN}remove{Colors.NC} <app-id>       Remove an app
+  {Colors.GREEN}import{Colors.NC} <file>         Bulk-import apps from a JSON file
   {Colors.GREEN}export{Colors.NC}                Export apps list to markdown
   {Colors.GREEN}help{Colors.NC}                  Show this help message
 
@@ -413,7 +657,17 @@ def print_usage():
   {sys.argv[0]} export
 
 {Colors.BOLD}Data file:{Colors.NC} {DATA_FILE}
-""")
+"""
+    print(_USAGE)
+
+
+def _require_arg(command: str, what: str, placeholder: str) -> str:
+    """Return sys.argv[2], or exit with a usage hint if it's missing"""
+    if len(sys.argv) < 3:
+        print_error(f"Please provide {what}")
+        print(f"Usage: {sys.argv[0]} {command} {placeholder}")
+        sys.exit(1)
+    return sys.argv[2]
 
 
 def main():
@@ -424,38 +678,28 @@ def main():
 
     command = sys.argv[1].lower()
 
-    if command in ['help', '-h', '--help']:
-        print_usage()
-    elif command == 'add':
-        add_app()
-    elif command == 'list':
-        filter_status = sys.argv[2] if len(sys.argv) > 2 else None
-        list_apps(filter_status)
-    elif command == 'view':
-        if len(sys.argv) < 3:
-            print_error("Please provide an app ID")
-            print(f"Usage: {sys.argv[0]} view <app-id>")
-            sys.exit(1)
-        view_app(sys.argv[2])
-    elif command == 'edit':
-        if len(sys.argv) < 3:
-            print_error("Please provide an app ID")
-            print(f"Usage: {sys.argv[0]} edit <app-id>")
-            sys.exit(1)
-        edit_app(sys.argv[2])
-    elif command == 'remove':
-        if len(sys.argv) < 3:
-            print_error("Please provide an app ID")
-            print(f"Usage: {sys.argv[0]} remove <app-id>")
-            sys.exit(1)
-        remove_app(sys.argv[2])
-    elif command == 'export':
-        export_markdown()
-    else:
+    # Dispatch through a jump table instead of an if/elif chain
+    commands = {
+        'help': print_usage,
+        '-h': print_usage,
+        '--help': print_usage,
+        'add': add_app,
+        'list': lambda: list_apps(sys.argv[2] if len(sys.argv) > 2 else None),
+        'view': lambda: view_app(_require_arg('view', 'an app ID', '<app-id>')),
+        'edit': lambda: edit_app(_require_arg('edit', 'an app ID', '<app-id>')),
+        'remove': lambda: remove_app(_require_arg('remove', 'an app ID', '<app-id>')),
+        'import': lambda: import_apps(_require_arg('import', 'a JSON file to import', '<file>')),
+        'export': export_markdown,
+    }
+
+    handler = commands.get(command)
+    if handler is None:
         print_error(f"Unknown command: {command}")
         print(f"Run '{sys.argv[0]} help' for usage information")
         sys.exit(1)
 
+    handler()
+
 
 if __name__ == "__main__":
     main()